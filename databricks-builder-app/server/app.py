@@ -24,6 +24,7 @@ from starlette.middleware.cors import CORSMiddleware
 from .db import is_postgres_configured, run_migrations, init_database
 from .routers import agent_router, clusters_router, config_router, conversations_router, projects_router, skills_router, warehouses_router
 from .services.backup_manager import start_backup_worker, stop_backup_worker
+from .services.databricks_tools import unload_databricks_tools
 from .services.skills_manager import copy_skills_to_app
 
 logger = logging.getLogger(__name__)
@@ -66,6 +67,7 @@ async def lifespan(app: FastAPI):
 
   logger.info('Shutting down application...')
   stop_backup_worker()
+  unload_databricks_tools()
 
 
 app = FastAPI(
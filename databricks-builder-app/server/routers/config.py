@@ -3,10 +3,10 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Query, Request, Response
 
 from ..db import get_lakebase_project_id, is_postgres_configured, test_database_connection
-from ..services.system_prompt import get_system_prompt
+from ..services.system_prompt import get_system_prompt_with_etag
 from ..services.user import get_current_user, get_workspace_url
 
 logger = logging.getLogger(__name__)
@@ -43,18 +43,38 @@ async def health_check():
 
 @router.get('/system_prompt')
 async def get_system_prompt_endpoint(
+  request: Request,
+  response: Response,
   cluster_id: Optional[str] = Query(None),
   warehouse_id: Optional[str] = Query(None),
   default_catalog: Optional[str] = Query(None),
   default_schema: Optional[str] = Query(None),
   workspace_folder: Optional[str] = Query(None),
 ):
-  """Get the system prompt with current configuration."""
-  prompt = get_system_prompt(
+  """Get the system prompt with current configuration.
+
+  Sets an ETag for the prompt; returns 304 if it matches If-None-Match.
+  """
+  prompt, etag = get_system_prompt_with_etag(
     cluster_id=cluster_id,
     default_catalog=default_catalog,
     default_schema=default_schema,
     warehouse_id=warehouse_id,
     workspace_folder=workspace_folder,
   )
+  if _etag_matches(request.headers.get('If-None-Match'), etag):
+    return Response(status_code=304, headers={'ETag': etag})
+
+  response.headers['ETag'] = etag
   return {'system_prompt': prompt}
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+  """Check an If-None-Match header against an ETag (weak comparison, RFC 9110)."""
+  if not if_none_match:
+    return False
+  for tag in if_none_match.split(','):
+    tag = tag.strip()
+    if tag == '*' or tag.removeprefix('W/') == etag:
+      return True
+  return False
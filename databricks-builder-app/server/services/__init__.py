@@ -10,7 +10,7 @@ from .backup_manager import (
 from .clusters import list_clusters_async
 from .skills_manager import SkillNotFoundError, copy_skills_to_app, copy_skills_to_project, get_available_skills, reload_project_skills
 from .storage import ConversationStorage, ProjectStorage
-from .system_prompt import get_system_prompt
+from .system_prompt import get_system_prompt, get_system_prompt_with_etag
 from .user import get_current_user, get_workspace_url
 
 __all__ = [
@@ -26,6 +26,7 @@ __all__ = [
   'get_project_directory',
   'get_stream_manager',
   'get_system_prompt',
+  'get_system_prompt_with_etag',
   'get_workspace_url',
   'list_clusters_async',
   'mark_for_backup',
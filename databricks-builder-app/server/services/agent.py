@@ -12,6 +12,7 @@ See: https://github.com/anthropics/claude-agent-sdk-python/issues/462
 """
 
 import asyncio
+import functools
 import logging
 import traceback
 import sys
@@ -37,7 +38,7 @@ from claude_agent_sdk.types import (
 from databricks_tools_core.auth import set_databricks_auth, clear_databricks_auth
 
 from .backup_manager import ensure_project_directory as _ensure_project_directory
-from .databricks_tools import load_databricks_tools
+from .databricks_tools import get_databricks_tools
 from .system_prompt import get_system_prompt
 
 logger = logging.getLogger(__name__)
@@ -53,28 +54,18 @@ BUILTIN_TOOLS = [
   'Skill',  # For loading skills
 ]
 
-# Cached Databricks tools (loaded once)
-_databricks_server = None
-_databricks_tool_names = None
-
-# Cached Claude settings (loaded once)
-_claude_settings = None
-
 
+@functools.cache
 def _load_claude_settings() -> dict:
   """Load Claude settings from repository root .claude/settings.json.
   
   This ensures the agent gets Databricks auth settings (ANTHROPIC_AUTH_TOKEN,
   ANTHROPIC_BASE_URL) even when running in project subdirectories.
+  Loaded once per process; call _load_claude_settings.cache_clear() to reload.
   
   Returns:
       Dictionary of environment variables from settings.json
   """
-  global _claude_settings
-  
-  if _claude_settings is not None:
-    return _claude_settings
-  
   # Navigate from server/services/agent.py up to ai-dev-kit/
   repo_root = Path(__file__).parent.parent.parent.parent
   settings_path = repo_root / ".claude" / "settings.json"
@@ -83,25 +74,14 @@ def _load_claude_settings() -> dict:
     try:
       with open(settings_path) as f:
         settings = json.load(f)
-        _claude_settings = settings.get("env", {})
         logger.info(f"Loaded Claude settings from {settings_path}")
-        return _claude_settings
+        return settings.get("env", {})
     except Exception as e:
       logger.warning(f"Failed to load Claude settings: {e}")
-      _claude_settings = {}
-      return _claude_settings
+      return {}
   else:
     logger.warning(f"Claude settings not found at {settings_path}")
-    _claude_settings = {}
-    return _claude_settings
-
-
-def get_databricks_tools():
-  """Get cached Databricks tools, loading if needed."""
-  global _databricks_server, _databricks_tool_names
-  if _databricks_server is None:
-    _databricks_server, _databricks_tool_names = load_databricks_tools()
-  return _databricks_server, _databricks_tool_names
+    return {}
 
 
 def get_project_directory(project_id: str) -> Path:
@@ -214,21 +194,28 @@ async def stream_agent_response(
     # Build allowed tools list
     allowed_tools = BUILTIN_TOOLS.copy()
 
-    # Get in-process Databricks tools
-    databricks_server, databricks_tool_names = get_databricks_tools()
+    # Load in-process Databricks tools and generate the system prompt (skills, cluster,
+    # warehouse, and catalog/schema context) concurrently, off the event loop
+    (databricks_server, databricks_tool_names), system_prompt = await asyncio.gather(
+      asyncio.to_thread(get_databricks_tools),
+      asyncio.to_thread(
+        get_system_prompt,
+        cluster_id=cluster_id,
+        default_catalog=default_catalog,
+        default_schema=default_schema,
+        warehouse_id=warehouse_id,
+        workspace_folder=workspace_folder,
+      ),
+    )
+
     allowed_tools.extend(databricks_tool_names)
     logger.info(f'Databricks MCP server configured with {len(databricks_tool_names)} tools')
 
-    # Generate system prompt with available skills, cluster, warehouse, and catalog/schema context
-    system_prompt = get_system_prompt(
-      cluster_id=cluster_id,
-      default_catalog=default_catalog,
-      default_schema=default_schema,
-      warehouse_id=warehouse_id,
-      workspace_folder=workspace_folder,
-    )
-
-    # Load Claude settings for Databricks model serving authentication
+    # Load Claude settings for Databricks model serving authentication.
+    # Only these deltas are passed; the SDK merges them over os.environ when it
+    # spawns the CLI, so no copy of the process environment is made here.
+    # ClaudeAgentOptions.env can only add or override variables, not drop
+    # inherited ones, so the CLI's environment cannot be narrowed from here.
     claude_env = _load_claude_settings()
 
     options = ClaudeAgentOptions(
@@ -2,45 +2,352 @@
 
 Scans FastMCP tools from databricks-mcp-server and creates
 in-process SDK tools for the Claude Code Agent SDK.
+
+The SDK server is built from a tool manifest (names, descriptions and
+schemas), cached on disk. Building the manifest imports databricks-mcp-server;
+that import runs in a background thread (warm start) or a bounded worker
+thread (cold start), off the request path. Tool calls look their function
+up in the already-imported FastMCP registry.
 """
 
 import asyncio
 import json
 import logging
-from typing import Any
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Literal
 
 from claude_agent_sdk import tool, create_sdk_mcp_server
 
 logger = logging.getLogger(__name__)
 
+# Shared encoder for tool results: json.dumps(..., default=str) builds a new one per call
+_result_encoder = json.JSONEncoder(default=str)
 
-def load_databricks_tools():
-    """Dynamically scan FastMCP tools and create in-process SDK MCP server.
+# Prefix the agent uses to address tools on the in-process 'databricks' server
+TOOL_NAME_PREFIX = 'mcp__databricks__'
 
-    Returns:
-        Tuple of (server_config, tool_names) where:
-        - server_config: McpSdkServerConfig for ClaudeAgentOptions.mcp_servers
-        - tool_names: List of tool names in mcp__databricks__* format
-    """
+# Long-lived in-process Databricks MCP server, shared by every agent session
+_databricks_server = None
+_databricks_tool_names: list[str] | None = None
+# Reentrant: a late manifest scan can be installed from the thread building the server
+_databricks_server_lock = threading.RLock()
+
+# Tool manifest (names, descriptions, JSON schemas) the SDK server is built from
+_databricks_tool_manifest: list[dict] | None = None
+_manifest_state: Literal['empty', 'loading', 'ready', 'failed'] = 'empty'
+_manifest_failed_until = 0.0
+_manifest_backoff = 0.0
+
+# On-disk tool manifest, valid for one installed databricks-mcp-server version
+TOOL_MANIFEST_CACHE_PATH = Path.home() / '.cache' / 'ai-dev-kit' / 'databricks_mcp_tools.json'
+
+# Default for MCP_STARTUP_TIMEOUT: seconds to wait for a cold manifest scan
+DEFAULT_MCP_STARTUP_TIMEOUT = 5.0
+
+# Backoff before rescanning after a failed manifest scan (doubles up to the max)
+MANIFEST_RETRY_INITIAL_SECONDS = 1.0
+MANIFEST_RETRY_MAX_SECONDS = 60.0
+
+
+def _create_server(sdk_tools: list):
+    """Create the in-process SDK MCP server and its mcp__databricks__* tool names."""
+    tool_names = [TOOL_NAME_PREFIX + t.name for t in sdk_tools]
+    server = create_sdk_mcp_server(name='databricks', tools=sdk_tools)
+    return server, tool_names
+
+
+def _build_sdk_tools() -> list:
+    """Wrap every tool in the manifest as an SDK tool."""
+    sdk_tools = [
+        _make_wrapper(entry['name'], entry['description'], _convert_schema(entry['parameters']))
+        for entry in get_databricks_tool_manifest()
+    ]
+    logger.info('Loaded %d Databricks tools', len(sdk_tools))
+    logger.debug('Databricks tools: %s', [t.name for t in sdk_tools])
+    return sdk_tools
+
+
+def _registered_tools() -> dict:
+    """Import databricks-mcp-server and return its FastMCP tool registry."""
     # Import triggers @mcp.tool registration
     from databricks_mcp_server.server import mcp
     from databricks_mcp_server.tools import sql, compute, file, pipelines  # noqa: F401
 
-    sdk_tools = []
-    tool_names = []
+    return mcp._tool_manager._tools
 
-    for name, mcp_tool in mcp._tool_manager._tools.items():
-        input_schema = _convert_schema(mcp_tool.parameters)
-        sdk_tool = _make_wrapper(name, mcp_tool.description, input_schema, mcp_tool.fn)
-        sdk_tools.append(sdk_tool)
-        tool_names.append(f'mcp__databricks__{name}')
 
-    logger.info(f'Loaded {len(sdk_tools)} Databricks tools: {[n.split("__")[-1] for n in tool_names]}')
+def _call_tool_fn(name: str, kwargs: dict[str, Any]) -> Any:
+    """Call a FastMCP tool function by name (runs in a worker thread)."""
+    return _registered_tools()[name].fn(**kwargs)
 
-    server = create_sdk_mcp_server(name='databricks', tools=sdk_tools)
+
+def _scan_tool_manifest() -> list[dict]:
+    """Build the tool manifest from the FastMCP registry and persist it to disk."""
+    global _manifest_backoff
+    manifest = [
+        {'name': name, 'description': t.description, 'parameters': t.parameters}
+        for name, t in _registered_tools().items()
+    ]
+    # A successful scan ends any run of failures (see _mark_manifest_failed)
+    _manifest_backoff = 0.0
+    _write_cached_manifest(manifest)
+    return manifest
+
+
+def _installed_version() -> str | None:
+    """Get the installed databricks-mcp-server version, or None if unknown."""
+    try:
+        return metadata.version('databricks-mcp-server')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _read_cached_manifest(any_version: bool = False) -> list[dict] | None:
+    """Read the on-disk manifest if it matches the installed server version.
+
+    Args:
+        any_version: Accept a manifest written for another server version
+    """
+    version = _installed_version()
+    if (version is None and not any_version) or not TOOL_MANIFEST_CACHE_PATH.exists():
+        return None
+
+    # Any unreadable or malformed cache is treated as a cache miss
+    try:
+        cached = json.loads(TOOL_MANIFEST_CACHE_PATH.read_text())
+        cached_version = cached['version']
+        tools = cached['tools']
+        if not isinstance(tools, list) or not all(_is_manifest_entry(t) for t in tools):
+            raise ValueError('unexpected manifest format')
+    except Exception as e:
+        logger.warning('Ignoring tool manifest cache %s: %r', TOOL_MANIFEST_CACHE_PATH, e)
+        return None
+
+    if cached_version != version and not any_version:
+        logger.info('Tool manifest cache is stale (installed version %s)', version)
+        return None
+    return tools
+
+
+def _is_manifest_entry(entry: Any) -> bool:
+    """Check that a cached manifest entry has the shape _scan_tool_manifest() writes."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get('name'), str)
+        and isinstance(entry.get('description'), (str, type(None)))
+        and isinstance(entry.get('parameters'), dict)
+    )
+
+
+def _write_cached_manifest(manifest: list[dict]) -> None:
+    """Persist the manifest to disk, tagged with the installed server version."""
+    version = _installed_version()
+    if version is None:
+        return
+
+    tmp_name = None
+    try:
+        TOOL_MANIFEST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        payload = {'tools': manifest, 'mtime': time.time(), 'version': version}
+        # Unique temp file per writer, so concurrent writers never replace each other's
+        # partial file
+        with tempfile.NamedTemporaryFile(
+            'w', dir=TOOL_MANIFEST_CACHE_PATH.parent, prefix=TOOL_MANIFEST_CACHE_PATH.name,
+            suffix='.tmp', delete=False,
+        ) as f:
+            tmp_name = f.name
+            f.write(json.dumps(payload))
+        os.replace(tmp_name, TOOL_MANIFEST_CACHE_PATH)
+    except Exception as e:
+        logger.warning('Failed to write tool manifest cache %s: %s', TOOL_MANIFEST_CACHE_PATH, e)
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def _install_tool_manifest(manifest: list[dict]) -> None:
+    """Replace the served manifest, dropping the SDK server if the tool set changed."""
+    global _databricks_tool_manifest, _databricks_server, _manifest_state
+    # Hold the server lock so a server being built from the old manifest isn't kept
+    with _databricks_server_lock:
+        if manifest != _databricks_tool_manifest:
+            logger.info('Databricks tool manifest changed, rebuilding tools on next use')
+            _databricks_tool_manifest = manifest
+            _databricks_server = None
+        _manifest_state = 'ready'
+
+
+def _refresh_tool_manifest() -> None:
+    """Rescan the tool manifest, replacing a stale one served from disk.
+
+    On failure the stale manifest is kept.
+    """
+    try:
+        manifest = _scan_tool_manifest()
+    except Exception as e:
+        logger.warning('Failed to refresh Databricks tool manifest, keeping cached one: %s', e)
+        return
+    _install_tool_manifest(manifest)
+
+
+def _mark_manifest_failed(error: BaseException) -> None:
+    """Back off after a failed manifest scan.
+
+    The backoff starts at MANIFEST_RETRY_INITIAL_SECONDS and doubles on each
+    consecutive failure up to MANIFEST_RETRY_MAX_SECONDS. Until it expires,
+    get_databricks_tool_manifest() does not rescan.
+    """
+    global _manifest_state, _manifest_failed_until, _manifest_backoff, _databricks_server
+    with _databricks_server_lock:
+        _manifest_backoff = min(
+            _manifest_backoff * 2 or MANIFEST_RETRY_INITIAL_SECONDS, MANIFEST_RETRY_MAX_SECONDS
+        )
+        _manifest_failed_until = time.monotonic() + _manifest_backoff
+        _manifest_state = 'failed'
+        _databricks_server = None
+    logger.error('Failed to load Databricks tools, retrying in %.0fs: %s', _manifest_backoff, error)
+
+
+def _on_late_tool_manifest(future: Future) -> None:
+    """Install a manifest scan that finished after the startup timeout."""
+    if future.exception() is None:
+        logger.info('Databricks tool manifest scan completed after startup timeout')
+        _install_tool_manifest(future.result())
+    else:
+        _mark_manifest_failed(future.exception())
+
+
+def _start_thread(target: Callable, name: str) -> None:
+    """Run target in a daemon thread."""
+    threading.Thread(target=target, name=name, daemon=True).start()
+
+
+def _get_startup_timeout() -> float:
+    """Read MCP_STARTUP_TIMEOUT at call time (after .env.local is loaded)."""
+    value = os.getenv('MCP_STARTUP_TIMEOUT')
+    if not value:
+        return DEFAULT_MCP_STARTUP_TIMEOUT
+    try:
+        timeout = float(value)
+    except ValueError:
+        timeout = -1.0
+    if timeout <= 0:
+        logger.warning(
+            'Invalid MCP_STARTUP_TIMEOUT %r, using %ss', value, DEFAULT_MCP_STARTUP_TIMEOUT
+        )
+        return DEFAULT_MCP_STARTUP_TIMEOUT
+    return timeout
+
+
+def _scan_tool_manifest_bounded() -> list[dict]:
+    """Scan the tool manifest, waiting at most MCP_STARTUP_TIMEOUT seconds.
+
+    On timeout the scan keeps running in the background and is installed when
+    it completes. Meanwhile any manifest cached on disk (even for another
+    server version) is served, or no tools at all.
+    """
+    timeout = _get_startup_timeout()
+    future = Future()
+
+    def scan():
+        try:
+            future.set_result(_scan_tool_manifest())
+        except Exception as e:
+            future.set_exception(e)
+
+    _start_thread(scan, 'tool-manifest-scan')
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        logger.warning(
+            'Databricks tool manifest scan exceeded %ss, serving cached tools until it completes',
+            timeout,
+        )
+        future.add_done_callback(_on_late_tool_manifest)
+        return _read_cached_manifest(any_version=True) or []
+
+
+def get_databricks_tool_manifest() -> list[dict]:
+    """Get the Databricks tool manifest.
+
+    Served from the on-disk cache when it matches the installed
+    databricks-mcp-server version (and refreshed in a background thread),
+    otherwise built by scanning the FastMCP registry (bounded by
+    MCP_STARTUP_TIMEOUT).
+
+    If the scan fails, no tools are returned and the scan is not retried
+    until an exponential backoff (up to MANIFEST_RETRY_MAX_SECONDS) expires.
+
+    Returns:
+        List of dicts with name, description and parameters (JSON schema)
+        for each Databricks tool
+    """
+    global _databricks_tool_manifest, _manifest_state
+    if _manifest_state == 'ready':
+        return _databricks_tool_manifest
+    if _manifest_state == 'failed' and time.monotonic() < _manifest_failed_until:
+        return _databricks_tool_manifest or []
+
+    _manifest_state = 'loading'
+    cached = _read_cached_manifest()
+    if cached is not None:
+        _databricks_tool_manifest = cached
+        _manifest_state = 'ready'
+        _start_thread(_refresh_tool_manifest, 'tool-manifest-refresh')
+        return cached
+
+    try:
+        manifest = _scan_tool_manifest_bounded()
+    except Exception as e:
+        _mark_manifest_failed(e)
+        return []
+
+    # A scan that finished after the timeout may already have installed its manifest
+    # (or failed, leaving this one as the fallback to serve)
+    if _manifest_state == 'loading':
+        _databricks_tool_manifest = manifest
+        _manifest_state = 'ready'
+    return _databricks_tool_manifest or manifest
+
+
+def get_databricks_tools():
+    """Get the shared Databricks MCP server, loading it on first use.
+
+    The server and its tool wrappers are created once per process and reused
+    by every agent session.
+
+    Returns:
+        Tuple of (server_config, tool_names) where:
+        - server_config: McpSdkServerConfig for ClaudeAgentOptions.mcp_servers
+        - tool_names: List of tool names in mcp__databricks__* format
+    """
+    global _databricks_server, _databricks_tool_names
+    server, tool_names = _databricks_server, _databricks_tool_names
+    if server is None:
+        # Agent sessions load tools from worker threads; build the server only once
+        with _databricks_server_lock:
+            if _databricks_server is not None:
+                return _databricks_server, _databricks_tool_names
+
+            server, tool_names = _create_server(_build_sdk_tools())
+            # Without a manifest the server has no tools; don't keep it past the backoff
+            if _manifest_state == 'ready':
+                _databricks_server, _databricks_tool_names = server, tool_names
     return server, tool_names
 
 
+def unload_databricks_tools() -> None:
+    """Drop the shared Databricks MCP server (called on application shutdown)."""
+    global _databricks_server, _databricks_tool_names
+    _databricks_server = None
+    _databricks_tool_names = None
+
+
 def _convert_schema(json_schema: dict) -> dict[str, type]:
     """Convert JSON schema to SDK simple format: {"param": type}"""
     type_map = {
@@ -66,7 +373,7 @@ def _convert_schema(json_schema: dict) -> dict[str, type]:
     return result
 
 
-def _make_wrapper(name: str, description: str, schema: dict, fn):
+def _make_wrapper(name: str, description: str, schema: dict):
     """Create SDK tool wrapper for a FastMCP function.
 
     The wrapper runs the sync function in a thread pool to avoid
@@ -76,9 +383,8 @@ def _make_wrapper(name: str, description: str, schema: dict, fn):
 
     @tool(name, description, schema)
     async def wrapper(args: dict[str, Any]) -> dict[str, Any]:
-        import sys
-        print(f'[MCP TOOL] {name} called with args: {args}', file=sys.stderr, flush=True)
-        logger.info(f'[MCP] Tool {name} called with args: {args}')
+        logger.info('[MCP] Tool %s called', name)
+        logger.debug('[MCP] Tool %s args: %s', name, args)
         try:
             # Parse JSON strings for complex types (Claude agent sometimes sends these as strings)
             parsed_args = {}
@@ -87,7 +393,7 @@ def _make_wrapper(name: str, description: str, schema: dict, fn):
                     # Try to parse as JSON if it looks like a list or dict
                     try:
                         parsed_args[key] = json.loads(value)
-                        print(f'[MCP TOOL] Parsed {key} from JSON string', file=sys.stderr, flush=True)
+                        logger.debug('[MCP] Tool %s: parsed %s from JSON string', name, key)
                     except json.JSONDecodeError:
                         # Not valid JSON, keep as string
                         parsed_args[key] = value
@@ -95,14 +401,13 @@ def _make_wrapper(name: str, description: str, schema: dict, fn):
                     parsed_args[key] = value
             
             # FastMCP tools are sync - run in thread pool
-            print(f'[MCP TOOL] Running {name} in thread pool...', file=sys.stderr, flush=True)
-            result = await asyncio.to_thread(fn, **parsed_args)
-            result_str = json.dumps(result, default=str)
-            print(f'[MCP TOOL] {name} completed, result length: {len(result_str)}', file=sys.stderr, flush=True)
+            logger.debug('[MCP] Running %s in thread pool', name)
+            result = await asyncio.to_thread(_call_tool_fn, name, parsed_args)
+            result_str = _result_encoder.encode(result)
+            logger.info('[MCP] Tool %s completed, result length: %d', name, len(result_str))
             return {'content': [{'type': 'text', 'text': result_str}]}
         except Exception as e:
-            print(f'[MCP TOOL] {name} FAILED: {e}', file=sys.stderr, flush=True)
-            logger.exception(f'[MCP] Tool {name} failed: {e}')
+            logger.exception('[MCP] Tool %s failed: %s', name, e)
             return {'content': [{'type': 'text', 'text': f'Error: {e}'}], 'is_error': True}
 
     return wrapper
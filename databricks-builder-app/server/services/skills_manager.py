@@ -16,6 +16,9 @@ SKILLS_SOURCE_DIR = Path(__file__).parent.parent.parent.parent / 'databricks-ski
 # Local cache of skills within this app (copied on startup)
 APP_SKILLS_DIR = Path(__file__).parent.parent.parent / 'skills'
 
+# Parsed skills keyed on _skills_key(); cleared by copy_skills_to_app()
+_skills_cache: tuple[tuple, list[dict]] | None = None
+
 
 def _get_enabled_skills() -> list[str] | None:
   """Get list of enabled skills from environment.
@@ -32,14 +35,49 @@ def _get_enabled_skills() -> list[str] | None:
 def get_available_skills() -> list[dict]:
   """Get list of available skills with their metadata.
 
+  The parsed skills are cached and reused while the skills directory and each
+  skill's SKILL.md are unchanged (see _skills_key()), so repeated calls stat
+  the files instead of reading and parsing every SKILL.md.
+
   Returns:
       List of dicts with name, description, and path for each skill
   """
-  skills = []
+  global _skills_cache
 
-  if not APP_SKILLS_DIR.exists():
+  try:
+    key = _skills_key()
+  except FileNotFoundError:
     logger.warning(f'Skills directory not found: {APP_SKILLS_DIR}')
-    return skills
+    return []
+
+  if _skills_cache is None or _skills_cache[0] != key:
+    _skills_cache = (key, _scan_skills())
+  return list(_skills_cache[1])
+
+
+def _skills_key() -> tuple:
+  """Get a cache key covering the skills directory and every SKILL.md in it.
+
+  A skill folder whose SKILL.md is not there yet (e.g. mid-copy) is part of the
+  key too, so the key changes once the file appears.
+
+  Raises:
+      FileNotFoundError: If the skills directory does not exist
+  """
+  stat = APP_SKILLS_DIR.stat()
+  entries = []
+  for skill_dir in APP_SKILLS_DIR.iterdir():
+    try:
+      md_stat = (skill_dir / 'SKILL.md').stat()
+      entries.append((skill_dir.name, md_stat.st_mtime_ns, md_stat.st_size))
+    except OSError:
+      entries.append((skill_dir.name, None, None))
+  return (stat.st_ino, stat.st_mtime_ns, tuple(sorted(entries)))
+
+
+def _scan_skills() -> list[dict]:
+  """Parse the SKILL.md frontmatter of every skill in the app skills directory."""
+  skills = []
 
   for skill_dir in APP_SKILLS_DIR.iterdir():
     if not skill_dir.is_dir():
@@ -96,6 +134,8 @@ def copy_skills_to_app() -> bool:
   Raises:
       SkillNotFoundError: If an enabled skill folder doesn't exist or lacks SKILL.md
   """
+  global _skills_cache
+
   if not SKILLS_SOURCE_DIR.exists():
     logger.warning(f'Skills source directory not found: {SKILLS_SOURCE_DIR}')
     return False
@@ -124,6 +164,10 @@ def copy_skills_to_app() -> bool:
         )
 
   try:
+    # Drop parsed skills before and after the copy, so a scan that lands mid-copy
+    # is not served once the copy is done
+    _skills_cache = None
+
     # Remove existing skills directory if it exists
     if APP_SKILLS_DIR.exists():
       shutil.rmtree(APP_SKILLS_DIR)
@@ -144,6 +188,7 @@ def copy_skills_to_app() -> bool:
         copied_count += 1
         logger.debug(f'Copied skill: {item.name}')
 
+    _skills_cache = None
     logger.info(f'Copied {copied_count} skills to {APP_SKILLS_DIR}')
     return True
 
@@ -1,7 +1,58 @@
 """System prompt for the Databricks AI Dev Kit agent."""
 
+import hashlib
+from functools import lru_cache
+
 from .skills_manager import get_available_skills
 
+# Static prompt fragments, joined around the per-request sections
+_PROMPT_HEAD = '# Databricks AI Dev Kit\n'
+
+_PROMPT_BODY = """
+
+You are a Databricks development assistant with access to MCP tools for building data pipelines,
+running SQL queries, managing infrastructure, and deploying assets to Databricks.
+
+When given a task, complete ALL steps automatically without stopping for approval.
+Execute the full workflow start to finish - do not present options or wait between steps.
+
+## Project Context
+
+**At the start of every conversation**, check if a `CLAUDE.md` file exists in the project root.
+If it exists, read it to understand the project state (tables, pipelines, volumes created).
+
+**Maintain a `CLAUDE.md` file** to track what has been created:
+- Update it after every significant action
+- Include: catalog/schema, table names, pipeline names, pipeline ids, volume paths, all databricks resources created name and ID
+Use it as storage to track all the resources created in the project, and be able to update them between conversations.
+
+## Tool Usage
+
+- **Always use MCP tools** - never use CLI commands, curl, or SDK code when an MCP tool exists
+- MCP tool names use the format `mcp__databricks__<tool_name>` (e.g., `mcp__databricks__execute_sql`)
+- Use `upload_folder`/`upload_file` for file uploads, never manual steps
+- Use `create_or_update_pipeline` for pipelines, never SDK code
+
+"""
+
+_SKILLS_HEAD = """
+## Skills
+
+Load skills using the `Skill` tool for detailed guidance on specific topics.
+
+Available skills:
+"""
+
+_PROMPT_TAIL = """
+
+## Workflow
+
+1. **Load the relevant skill FIRST** - Skills contain detailed guidance and best practices
+2. **Use MCP tools** for all Databricks operations
+3. **Complete workflows automatically** - Don't stop halfway or ask users to do manual steps
+4. **Verify results** - Use `get_table_details` to confirm data was written correctly
+"""
+
 
 def get_system_prompt(
   cluster_id: str | None = None,
@@ -13,6 +64,8 @@ def get_system_prompt(
   """Generate the system prompt for the Claude agent.
 
   Explains Databricks capabilities, available MCP tools, and skills.
+  Rendered prompts are memoized on the skills and the arguments, so the
+  prompt is only rebuilt when one of them changes.
 
   Args:
       cluster_id: Optional Databricks cluster ID for code execution
@@ -24,20 +77,56 @@ def get_system_prompt(
   Returns:
       System prompt string
   """
-  skills = get_available_skills()
+  return _render_system_prompt(
+    _skills_signature(), cluster_id, default_catalog, default_schema, warehouse_id,
+    workspace_folder,
+  )
 
-  skills_section = ''
-  if skills:
-    skill_list = '\n'.join(f"  - **{s['name']}**: {s['description']}" for s in skills)
-    skills_section = f"""
-## Skills
 
-Load skills using the `Skill` tool for detailed guidance on specific topics.
+def get_system_prompt_with_etag(
+  cluster_id: str | None = None,
+  default_catalog: str | None = None,
+  default_schema: str | None = None,
+  warehouse_id: str | None = None,
+  workspace_folder: str | None = None,
+) -> tuple[str, str]:
+  """Get the system prompt together with a strong ETag for it.
+
+  Same arguments as get_system_prompt(). Both come from one read of the
+  skills, so the tag always matches the returned prompt. The tag is a hash
+  of the UTF-8 prompt, computed once and memoized with it.
+
+  Returns:
+      Tuple of (system prompt string, quoted entity tag)
+  """
+  return _tag_system_prompt(
+    _skills_signature(), cluster_id, default_catalog, default_schema, warehouse_id,
+    workspace_folder,
+  )
+
+
+def _skills_signature() -> tuple[tuple[str, str], ...]:
+  """Get the (name, description) pairs of the available skills."""
+  return tuple((s['name'], s['description']) for s in get_available_skills())
 
-Available skills:
-{skill_list}
-"""
 
+@lru_cache(maxsize=128)
+def _tag_system_prompt(*args) -> tuple[str, str]:
+  """Render a system prompt (see _render_system_prompt) and compute its ETag."""
+  prompt = _render_system_prompt(*args)
+  return prompt, f'"{hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]}"'
+
+
+@lru_cache(maxsize=128)
+def _render_system_prompt(
+  skills: tuple[tuple[str, str], ...],
+  cluster_id: str | None,
+  default_catalog: str | None,
+  default_schema: str | None,
+  warehouse_id: str | None,
+  workspace_folder: str | None,
+) -> str:
+  """Render the system prompt for a (name, description) skills signature."""
   cluster_section = ''
   if cluster_id:
     cluster_section = f"""
@@ -97,38 +186,21 @@ The user has configured default catalog/schema settings:"""
     if default_schema:
       catalog_schema_section = catalog_schema_section.replace('{schema}', default_schema)
 
-  return f"""# Databricks AI Dev Kit
-{cluster_section}{warehouse_section}{workspace_folder_section}{catalog_schema_section}
-
-You are a Databricks development assistant with access to MCP tools for building data pipelines,
-running SQL queries, managing infrastructure, and deploying assets to Databricks.
-
-When given a task, complete ALL steps automatically without stopping for approval.
-Execute the full workflow start to finish - do not present options or wait between steps.
-
-## Project Context
-
-**At the start of every conversation**, check if a `CLAUDE.md` file exists in the project root.
-If it exists, read it to understand the project state (tables, pipelines, volumes created).
-
-**Maintain a `CLAUDE.md` file** to track what has been created:
-- Update it after every significant action
-- Include: catalog/schema, table names, pipeline names, pipeline ids, volume paths, all databricks resources created name and ID
-Use it as storage to track all the resources created in the project, and be able to update them between conversations.
-
-## Tool Usage
-
-- **Always use MCP tools** - never use CLI commands, curl, or SDK code when an MCP tool exists
-- MCP tool names use the format `mcp__databricks__<tool_name>` (e.g., `mcp__databricks__execute_sql`)
-- Use `upload_folder`/`upload_file` for file uploads, never manual steps
-- Use `create_or_update_pipeline` for pipelines, never SDK code
-
-{skills_section}
-
-## Workflow
-
-1. **Load the relevant skill FIRST** - Skills contain detailed guidance and best practices
-2. **Use MCP tools** for all Databricks operations
-3. **Complete workflows automatically** - Don't stop halfway or ask users to do manual steps
-4. **Verify results** - Use `get_table_details` to confirm data was written correctly
-"""
+  parts = [
+    _PROMPT_HEAD,
+    cluster_section,
+    warehouse_section,
+    workspace_folder_section,
+    catalog_schema_section,
+    _PROMPT_BODY,
+    _render_skills(skills),
+    _PROMPT_TAIL,
+  ]
+  return ''.join(parts)
+
+
+def _render_skills(skills: tuple[tuple[str, str], ...]) -> str:
+  """Render the skills section of the system prompt."""
+  if not skills:
+    return ''
+  return _SKILLS_HEAD + ''.join(f'  - **{name}**: {description}\n' for name, description in skills)
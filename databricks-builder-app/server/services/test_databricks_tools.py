@@ -0,0 +1,186 @@
+"""Tests for the Databricks tool manifest loader."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+
+def _registry(*names):
+  """Build a fake FastMCP tool registry with the given tool names."""
+  return {
+    name: SimpleNamespace(
+      description=f'{name} tool',
+      parameters={'type': 'object', 'properties': {}},
+      fn=lambda: name,
+    )
+    for name in names
+  }
+
+
+def _write_cache(dt, names, version='1.0'):
+  """Write an on-disk manifest cache for the given tool names."""
+  tools = [
+    {'name': n, 'description': t.description, 'parameters': t.parameters}
+    for n, t in _registry(*names).items()
+  ]
+  dt.TOOL_MANIFEST_CACHE_PATH.write_text(
+    json.dumps({'tools': tools, 'mtime': 0, 'version': version})
+  )
+
+
+def _names(manifest):
+  return [entry['name'] for entry in manifest]
+
+
+@pytest.fixture
+def dt(monkeypatch, tmp_path):
+  """databricks_tools with fresh module state, a temp cache and a fake registry."""
+  from server.services import databricks_tools as dt
+
+  monkeypatch.setattr(dt, 'TOOL_MANIFEST_CACHE_PATH', tmp_path / 'tools.json')
+  monkeypatch.setattr(dt, '_installed_version', lambda: '1.0')
+  monkeypatch.setattr(dt, '_registered_tools', lambda: _registry('execute_sql'))
+  monkeypatch.setattr(dt, '_databricks_server', None)
+  monkeypatch.setattr(dt, '_databricks_tool_names', None)
+  monkeypatch.setattr(dt, '_databricks_tool_manifest', None)
+  monkeypatch.setattr(dt, '_manifest_state', 'empty')
+  monkeypatch.setattr(dt, '_manifest_failed_until', 0.0)
+  monkeypatch.setattr(dt, '_manifest_backoff', 0.0)
+  monkeypatch.delenv('MCP_STARTUP_TIMEOUT', raising=False)
+  return dt
+
+
+def test_cold_scan_builds_and_caches_manifest(dt):
+  """Without a cache the registry is scanned and the manifest written to disk."""
+  assert _names(dt.get_databricks_tool_manifest()) == ['execute_sql']
+  assert dt._manifest_state == 'ready'
+
+  cached = json.loads(dt.TOOL_MANIFEST_CACHE_PATH.read_text())
+  assert cached['version'] == '1.0'
+  assert _names(cached['tools']) == ['execute_sql']
+  assert list(dt.TOOL_MANIFEST_CACHE_PATH.parent.iterdir()) == [dt.TOOL_MANIFEST_CACHE_PATH]
+
+
+def test_warm_cache_is_served_then_refreshed(dt, monkeypatch):
+  """A cache for the installed version is served; the refresh replaces it."""
+  _write_cache(dt, ['old_tool'])
+  monkeypatch.setattr(dt, '_registered_tools', lambda: _registry('new_tool'))
+  started = []
+  monkeypatch.setattr(dt, '_start_thread', lambda target, name: started.append(target))
+
+  assert _names(dt.get_databricks_tool_manifest()) == ['old_tool']
+  assert len(started) == 1
+
+  dt._databricks_server = object()
+  started[0]()
+  assert _names(dt.get_databricks_tool_manifest()) == ['new_tool']
+  assert dt._databricks_server is None
+
+
+def test_cache_for_other_version_is_rescanned(dt):
+  """A cache written for another server version is not served."""
+  _write_cache(dt, ['old_tool'], version='0.9')
+
+  assert _names(dt.get_databricks_tool_manifest()) == ['execute_sql']
+  assert json.loads(dt.TOOL_MANIFEST_CACHE_PATH.read_text())['version'] == '1.0'
+
+
+@pytest.mark.parametrize(
+  'payload',
+  [
+    'not json',
+    '[]',
+    '{"version": "1.0"}',
+    '{"version": "1.0", "tools": {}}',
+    '{"version": "1.0", "tools": [{"name": 1}]}',
+  ],
+)
+def test_malformed_cache_is_a_miss(dt, payload):
+  """Any unreadable cache falls back to a scan instead of failing the load."""
+  dt.TOOL_MANIFEST_CACHE_PATH.write_text(payload)
+
+  assert _names(dt.get_databricks_tool_manifest()) == ['execute_sql']
+  assert dt._manifest_state == 'ready'
+
+
+def test_slow_scan_serves_fallback_then_installs_late_result(dt, monkeypatch):
+  """A scan past MCP_STARTUP_TIMEOUT serves any cache, then installs the scan result."""
+  _write_cache(dt, ['old_tool'], version='0.9')
+  release = threading.Event()
+
+  def slow_registry():
+    release.wait(5)
+    return _registry('new_tool')
+
+  monkeypatch.setattr(dt, '_registered_tools', slow_registry)
+  monkeypatch.setenv('MCP_STARTUP_TIMEOUT', '0.05')
+
+  assert _names(dt.get_databricks_tool_manifest()) == ['old_tool']
+
+  dt._databricks_server = object()
+  release.set()
+  deadline = time.monotonic() + 5
+  while _names(dt.get_databricks_tool_manifest()) != ['new_tool']:
+    assert time.monotonic() < deadline, 'late scan result was not installed'
+    time.sleep(0.01)
+  assert dt._databricks_server is None
+
+
+def test_failed_scan_backs_off_exponentially(dt, monkeypatch):
+  """A failed scan is not retried until its backoff expires; the backoff doubles."""
+  now = [1000.0]
+  monkeypatch.setattr(dt.time, 'monotonic', lambda: now[0])
+  scans = []
+
+  def broken_registry():
+    scans.append(now[0])
+    raise ImportError('databricks_mcp_server not installed')
+
+  monkeypatch.setattr(dt, '_registered_tools', broken_registry)
+
+  assert dt.get_databricks_tool_manifest() == []
+  assert (dt._manifest_state, dt._manifest_backoff) == ('failed', 1.0)
+
+  now[0] += 0.5
+  assert dt.get_databricks_tool_manifest() == []
+  assert len(scans) == 1
+
+  now[0] += 0.5
+  assert dt.get_databricks_tool_manifest() == []
+  assert len(scans) == 2
+  assert dt._manifest_backoff == 2.0
+
+  now[0] += 2.0
+  monkeypatch.setattr(dt, '_registered_tools', lambda: _registry('execute_sql'))
+  assert _names(dt.get_databricks_tool_manifest()) == ['execute_sql']
+  assert (dt._manifest_state, dt._manifest_backoff) == ('ready', 0.0)
+
+
+def test_failed_scan_backoff_is_capped(dt, monkeypatch):
+  """The backoff stops doubling at MANIFEST_RETRY_MAX_SECONDS."""
+  monkeypatch.setattr(dt, '_manifest_backoff', dt.MANIFEST_RETRY_MAX_SECONDS)
+
+  dt._mark_manifest_failed(ImportError('boom'))
+  assert dt._manifest_backoff == dt.MANIFEST_RETRY_MAX_SECONDS
+
+
+@pytest.mark.parametrize(
+  'value, expected',
+  [
+    (None, 5.0),
+    ('', 5.0),
+    ('abc', 5.0),
+    ('0', 5.0),
+    ('-1', 5.0),
+    ('0.5', 0.5),
+  ],
+)
+def test_startup_timeout_from_env(dt, monkeypatch, value, expected):
+  """MCP_STARTUP_TIMEOUT is read at call time; invalid values fall back to the default."""
+  if value is not None:
+    monkeypatch.setenv('MCP_STARTUP_TIMEOUT', value)
+
+  assert dt._get_startup_timeout() == expected